@@ -4,6 +4,18 @@ import asyncio
 import httpx
 from typing import Any
 
+# Prefer orjson's native parser when available; json.loads also accepts
+# bytes, so either way the response body is decoded without an
+# intermediate str round-trip
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+
 
 class APIError(Exception):
     """Base exception for API-related errors."""
@@ -30,6 +42,63 @@ class HTTPError(APIError):
     pass
 
 
+# URL schemes accepted by fetch_json, hoisted so validation reuses one tuple.
+_VALID_SCHEMES: tuple[str, str] = ("http://", "https://")
+
+# Default request timeout, shared so the common case skips building a new
+# httpx.Timeout object per call.
+_DEFAULT_TIMEOUT_SECONDS = 10.0
+_DEFAULT_TIMEOUT = httpx.Timeout(_DEFAULT_TIMEOUT_SECONDS)
+
+# asyncio.timeout (Python 3.11+) enforces deadlines with a C-implemented
+# cancellation scope; on 3.10 we fall back to httpx's per-request timeout.
+_ASYNCIO_TIMEOUT = getattr(asyncio, "timeout", None)
+
+# Shared HTTP client, created lazily so connections are pooled and reused
+# across tool calls instead of paying a TCP+TLS handshake per request.
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+async def _get_client() -> httpx.AsyncClient:
+    """
+    Return the shared AsyncClient, creating it on first use.
+
+    The client is bound to the running event loop; if the loop has changed
+    (e.g. across test runs), a fresh client is created to avoid
+    "Event loop is closed" errors.
+    """
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        if _client is not None:
+            # The previous client's connections belong to another loop,
+            # possibly already closed; close what can still be closed
+            # instead of silently abandoning the pool
+            try:
+                await _client.aclose()
+            except RuntimeError:
+                pass
+        _client = httpx.AsyncClient(
+            follow_redirects=True,
+            timeout=_DEFAULT_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30),
+        )
+        _client_loop = loop
+    return _client
+
+
+async def aclose() -> None:
+    """Close the shared HTTP client, releasing pooled connections."""
+    global _client, _client_loop
+
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        _client_loop = None
+
+
 async def fetch_json(url: str, timeout: float = 10.0) -> dict[str, Any]:
     """
     Fetch JSON data from a public HTTP API.
@@ -57,39 +126,51 @@ async def fetch_json(url: str, timeout: float = 10.0) -> dict[str, Any]:
         {"name": "cpython", "full_name": "python/cpython", ...}
     """
     # Validate URL scheme
-    if not url.startswith(("http://", "https://")):
+    if not url.startswith(_VALID_SCHEMES):
         raise InvalidURLError(
             f"Invalid URL scheme. URL must start with http:// or https://. Got: {url}"
         )
 
     try:
-        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-            try:
-                response = await client.get(url)
-                response.raise_for_status()
-            except httpx.TimeoutException as e:
-                raise TimeoutError(
-                    f"Request timed out after {timeout} seconds for URL: {url}"
-                ) from e
-            except httpx.HTTPStatusError as e:
-                raise HTTPError(
-                    f"HTTP {e.response.status_code} error for URL: {url}"
-                ) from e
-            except httpx.InvalidURL as e:
-                raise InvalidURLError(f"Invalid URL format: {url}") from e
-            except httpx.RequestError as e:
-                raise APIError(
-                    f"Network error occurred while fetching {url}: {str(e)}"
-                ) from e
-
-            # Parse JSON response
-            try:
-                return response.json()
-            except Exception as e:
-                raise JSONDecodeError(
-                    f"Failed to decode JSON response from {url}. "
-                    f"Response may not be valid JSON."
-                ) from e
+        client = await _get_client()
+        try:
+            if _ASYNCIO_TIMEOUT is not None:
+                # The cancellation scope owns the deadline, so disable
+                # httpx's own watchdog for this request
+                async with _ASYNCIO_TIMEOUT(timeout):
+                    response = await client.get(url, timeout=None)
+            else:
+                request_timeout = (
+                    _DEFAULT_TIMEOUT
+                    if timeout == _DEFAULT_TIMEOUT_SECONDS
+                    else httpx.Timeout(timeout)
+                )
+                response = await client.get(url, timeout=request_timeout)
+        except (httpx.TimeoutException, asyncio.TimeoutError) as e:
+            raise TimeoutError(
+                f"Request timed out after {timeout} seconds for URL: {url}"
+            ) from e
+        except httpx.InvalidURL as e:
+            raise InvalidURLError(f"Invalid URL format: {url}") from e
+        except httpx.RequestError as e:
+            raise APIError(
+                f"Network error occurred while fetching {url}: {str(e)}"
+            ) from e
+
+        # Check the status code directly instead of raise_for_status(),
+        # which builds a rich exception message even on the success path
+        status_code = response.status_code
+        if status_code >= 400:
+            raise HTTPError(f"HTTP {status_code} error for URL: {url}")
+
+        # Parse JSON response
+        try:
+            return _json_loads(response.content)
+        except Exception as e:
+            raise JSONDecodeError(
+                f"Failed to decode JSON response from {url}. "
+                f"Response may not be valid JSON."
+            ) from e
 
     except APIError:
         # Re-raise our custom exceptions
@@ -100,3 +181,37 @@ async def fetch_json(url: str, timeout: float = 10.0) -> dict[str, Any]:
     except Exception as e:
         # Catch any other unexpected errors
         raise APIError(f"Unexpected error fetching {url}: {str(e)}") from e
+
+
+async def fetch_json_many(urls: list[str], timeout: float = 10.0) -> list[dict[str, Any]]:
+    """
+    Fetch JSON data from multiple URLs concurrently.
+
+    All requests are launched at once on the shared HTTP client, so total
+    latency is roughly that of the slowest request rather than the sum of
+    all of them. Failures are reported in-line per URL instead of raising,
+    so a single bad URL doesn't sink the whole batch.
+
+    Args:
+        urls: The HTTP(S) URLs to fetch JSON from
+        timeout: Per-request timeout in seconds (default: 10.0)
+
+    Returns:
+        A list of results in the same order as the input URLs. Each result
+        is either the parsed JSON response or an error entry of the form
+        {"url": ..., "error": ...}.
+
+    Example:
+        >>> await fetch_json_many([
+        ...     "https://api.example.com/a",
+        ...     "https://api.example.com/b",
+        ... ])
+        [{"name": "a"}, {"url": "https://api.example.com/b", "error": "..."}]
+    """
+    async def _one(url: str) -> dict[str, Any]:
+        try:
+            return await fetch_json(url, timeout)
+        except APIError as e:
+            return {"url": url, "error": str(e)}
+
+    return await asyncio.gather(*(_one(url) for url in urls))
@@ -10,3 +10,9 @@ ENVIRONMENT = "development"
 # Filesystem sandbox configuration
 PROJECT_ROOT = Path(__file__).parent.parent
 SANDBOX_ROOT = PROJECT_ROOT / "sandbox"
+
+# Create and resolve the sandbox once at import time; resolve() walks the
+# whole directory chain, so doing it per validation would cost O(depth)
+# syscalls on every filesystem call
+SANDBOX_ROOT.mkdir(parents=True, exist_ok=True)
+SANDBOX_ROOT_RESOLVED = SANDBOX_ROOT.resolve()
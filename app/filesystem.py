@@ -1,10 +1,32 @@
 """Filesystem operations with sandbox security."""
 
+import errno
 import os
-from pathlib import Path
+import stat
+import time
+from collections import OrderedDict
+from operator import itemgetter
+from pathlib import Path, PurePath
 from typing import List, Dict
 
-from app.config import SANDBOX_ROOT
+from app.config import SANDBOX_ROOT, SANDBOX_ROOT_RESOLVED
+
+# Sandbox bound check as a plain string prefix: the trailing separator
+# keeps sibling directories like "sandbox_evil" from matching "sandbox"
+_SANDBOX_PREFIX = os.fspath(SANDBOX_ROOT_RESOLVED) + os.sep
+
+# Sort key for (name, stat) directory entries; a C-level itemgetter
+# avoids a Python frame per comparison that a lambda would cost
+_BY_NAME = itemgetter(0)
+
+# os.readv fills a caller-owned buffer with no intermediate bytes object,
+# but it is POSIX-only; Windows falls back to os.read plus a copy
+_HAS_READV = hasattr(os, "readv")
+
+# On POSIX os.scandir can enumerate an already-open directory fd, letting
+# an O_NOFOLLOW-guarded open pin the directory before it is read; Windows
+# has neither O_DIRECTORY nor fd-based scandir and uses the path directly
+_SCANDIR_TAKES_FD = os.scandir in os.supports_fd
 
 
 class PathValidationError(Exception):
@@ -12,6 +34,55 @@ class PathValidationError(Exception):
     pass
 
 
+# Cache of successfully-validated paths, keyed by the raw input path.
+# A hit skips re-parsing and the resolve() walk (O(depth) syscalls from
+# /), but the per-segment symlink check is re-run on every hit so links
+# created after validation are still caught. Failures are never cached.
+_VALIDATION_TTL = 1.0
+_VALIDATION_CACHE_MAX = 1024
+_validation_cache: OrderedDict[str, tuple[float, Path]] = OrderedDict()
+
+# Negative cache for read_file: MCP clients often probe many non-existent
+# paths (config files, alternate extensions), each costing a validation
+# walk plus an open that fails with ENOENT. The sandbox is writable, so
+# the TTL is kept very short to pick up newly-created files quickly.
+_NEGATIVE_TTL = 0.5
+_NEGATIVE_CACHE_MAX = 256
+_negative_cache: OrderedDict[str, float] = OrderedDict()
+
+
+def _clear_validation_cache() -> None:
+    """Flush the path caches (e.g. after sandbox mutations)."""
+    _validation_cache.clear()
+    _negative_cache.clear()
+
+
+def _reject_symlinks(base: Path, parts, original: str) -> None:
+    """
+    lstat each path segment below base, raising if any is a symlink.
+
+    Stops at the first missing segment: nothing below it exists yet, so
+    there is nothing to check.
+    """
+    current = base
+    for part in parts:
+        current = current / part
+        try:
+            st = os.lstat(current)
+        except (FileNotFoundError, NotADirectoryError):
+            break
+        if stat.S_ISLNK(st.st_mode):
+            raise PathValidationError(f"Symlinks are not allowed: {original}")
+
+
+def _remember(cache_key: str, validated: Path) -> Path:
+    """Record a successful validation in the bounded TTL cache."""
+    _validation_cache[cache_key] = (time.monotonic(), validated)
+    if len(_validation_cache) > _VALIDATION_CACHE_MAX:
+        _validation_cache.popitem(last=False)
+    return validated
+
+
 def validate_path(path: str) -> Path:
     """
     Validate and resolve a path within the sandbox.
@@ -25,42 +96,66 @@ def validate_path(path: str) -> Path:
     Raises:
         PathValidationError: If path escapes sandbox or is invalid
     """
-    try:
-        # Ensure sandbox exists
-        SANDBOX_ROOT.mkdir(parents=True, exist_ok=True)
+    cache_key = path
+    cached = _validation_cache.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < _VALIDATION_TTL:
+        full_path = cached[1]
+        # Symlinks may have appeared anywhere along the cached path since
+        # it was validated, so the per-segment walk is never skipped
+        try:
+            _reject_symlinks(
+                SANDBOX_ROOT_RESOLVED,
+                full_path.parts[len(SANDBOX_ROOT_RESOLVED.parts):],
+                path,
+            )
+        except PathValidationError:
+            _validation_cache.pop(cache_key, None)
+            raise
+        return full_path
 
-        # Resolve the full path
-        if path.startswith('/'):
-            # Remove leading slash for relative path
-            path = path.lstrip('/')
+    try:
+        # Remove leading slashes so the path is relative to the sandbox
+        path = path.lstrip('/')
+
+        if path == "":
+            return SANDBOX_ROOT_RESOLVED
+
+        # Fast path: without ".." segments the path cannot escape the
+        # sandbox, so only the per-segment symlink check is needed and the
+        # full resolve() walk (O(depth) syscalls from /) can be skipped.
+        # PurePath splits on every separator the host recognizes (on
+        # Windows "..\\secret" is a traversal, not a filename), and the
+        # anchor check sends drive-qualified or rooted inputs through the
+        # resolve()-and-bound-check slow path instead
+        pure = PurePath(path)
+        parts = pure.parts
+        if '..' not in parts and not pure.anchor and '\x00' not in path:
+            _reject_symlinks(SANDBOX_ROOT_RESOLVED, parts, path)
+            return _remember(cache_key, SANDBOX_ROOT_RESOLVED / path)
 
         candidate_path = SANDBOX_ROOT / path
 
         # Check for symlinks before resolving to prevent information leakage
-        # Check the target path and all parent directories for symlinks
-        current = candidate_path
-        sandbox_resolved = SANDBOX_ROOT.resolve()
-
-        while current != sandbox_resolved:
-            if current.exists() and current.is_symlink():
-                raise PathValidationError(
-                    f"Symlinks are not allowed: {path}"
-                )
-            if current == current.parent:
-                break
-            current = current.parent
+        # Walk each path segment below the sandbox with a single lstat call
+        # (Path.exists() + Path.is_symlink() would cost two stats per segment)
+        _reject_symlinks(
+            SANDBOX_ROOT,
+            candidate_path.parts[len(SANDBOX_ROOT.parts):],
+            path,
+        )
 
         # Now resolve to handle .. and check bounds
         full_path = candidate_path.resolve()
 
-        # Check if resolved path is within sandbox
-        # Use is_relative_to() to prevent sibling directory attacks
-        if not full_path.is_relative_to(sandbox_resolved):
+        # Check if resolved path is within sandbox via a single C-level
+        # startswith; the appended separator also lets the sandbox root
+        # itself pass while still blocking sibling-directory attacks
+        if not (os.fspath(full_path) + os.sep).startswith(_SANDBOX_PREFIX):
             raise PathValidationError(
                 f"Path '{path}' attempts to escape sandbox"
             )
 
-        return full_path
+        return _remember(cache_key, full_path)
 
     except (ValueError, OSError) as e:
         raise PathValidationError(f"Invalid path '{path}': {e}")
@@ -83,29 +178,78 @@ def list_directory(path: str = "") -> List[Dict[str, str]]:
     """
     full_path = validate_path(path)
 
-    if not full_path.exists():
-        raise FileNotFoundError(f"Directory not found: {path}")
-
-    if not full_path.is_dir():
-        raise NotADirectoryError(f"Not a directory: {path}")
-
+    # Use os.scandir: DirEntry caches metadata from the directory read, so
+    # is_symlink()/stat(follow_symlinks=False) share one syscall per entry
+    # instead of the two stats iterdir + lstat would cost. Missing or
+    # non-directory paths are reported by scandir itself, so no exists()/
+    # is_dir() pre-checks (two stat syscalls) are needed. Where possible
+    # the directory is pinned with an O_NOFOLLOW open first, so a symlink
+    # swapped in after validation is refused instead of followed
+    try:
+        if _SCANDIR_TAKES_FD:
+            dir_fd = os.open(
+                full_path,
+                os.O_RDONLY
+                | getattr(os, "O_CLOEXEC", 0)
+                | getattr(os, "O_DIRECTORY", 0)
+                | getattr(os, "O_NOFOLLOW", 0),
+            )
+            try:
+                # DirEntry defers stat() to a dir_fd-relative call, so
+                # materialize the stats while the fd is still open; the
+                # comprehension skips symlinks to prevent leakage
+                with os.scandir(dir_fd) as it:
+                    raw_entries = [
+                        (e.name, e.stat(follow_symlinks=False))
+                        for e in it
+                        if not e.is_symlink()
+                    ]
+            finally:
+                os.close(dir_fd)
+        else:
+            with os.scandir(full_path) as it:
+                raw_entries = [
+                    (e.name, e.stat(follow_symlinks=False))
+                    for e in it
+                    if not e.is_symlink()
+                ]
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Directory not found: {path}") from e
+    except NotADirectoryError as e:
+        # O_NOFOLLOW | O_DIRECTORY also reports a symlink as ENOTDIR, so
+        # tell the two cases apart before translating
+        try:
+            is_link = stat.S_ISLNK(os.lstat(full_path).st_mode)
+        except OSError:
+            is_link = False
+        if is_link:
+            raise PathValidationError(f"Symlinks are not allowed: {path}") from e
+        raise NotADirectoryError(f"Not a directory: {path}") from e
+    except OSError as e:
+        if e.errno == errno.ELOOP:
+            # Without O_DIRECTORY, O_NOFOLLOW reports a symlink as ELOOP
+            raise PathValidationError(f"Symlinks are not allowed: {path}") from e
+        raise
+    raw_entries.sort(key=_BY_NAME)
+
+    # Entry paths share one directory prefix, computed once; fd-based
+    # scandir reports DirEntry.path as just the name, so join it here
+    rel_dir = os.path.relpath(os.fspath(full_path), str(SANDBOX_ROOT))
     entries = []
-    for item in sorted(full_path.iterdir()):
-        # Skip symlinks to prevent information leakage outside sandbox
-        if item.is_symlink():
-            continue
-
-        # Use lstat() to avoid following symlinks
-        item_stat = item.lstat()
-        is_dir = item_stat.st_mode & 0o040000  # S_IFDIR
+    for name, item_stat in raw_entries:
+        is_dir = stat.S_ISDIR(item_stat.st_mode)
 
         entry = {
-            "name": item.name,
+            "name": name,
             "type": "directory" if is_dir else "file",
-            "path": str(item.relative_to(SANDBOX_ROOT))
+            "path": (
+                name
+                if rel_dir == os.curdir
+                else os.path.join(rel_dir, name)
+            )
         }
 
-        # Add size for files (using lstat data)
+        # Add size for files
         if not is_dir:
             entry["size"] = item_stat.st_size
 
@@ -130,16 +274,73 @@ def read_file(path: str) -> str:
         IsADirectoryError: If path is a directory
         UnicodeDecodeError: If file is not valid text
     """
+    # Repeated probes for a missing file are answered from the negative
+    # cache instead of re-running the validation walk and a failing open
+    ts = _negative_cache.get(path)
+    if ts is not None and time.monotonic() - ts < _NEGATIVE_TTL:
+        raise FileNotFoundError(f"File not found: {path}")
+
     full_path = validate_path(path)
 
-    if not full_path.exists():
-        raise FileNotFoundError(f"File not found: {path}")
+    # Open directly and translate the OS errors rather than pre-checking
+    # with exists()/is_dir(), which would cost two extra stat syscalls.
+    # O_NOFOLLOW makes the open itself refuse a symlink as the final
+    # component, closing the window where one is created after a path was
+    # validated but while it is still in the TTL cache
+    try:
+        fd = os.open(
+            full_path,
+            os.O_RDONLY
+            | getattr(os, "O_CLOEXEC", 0)
+            | getattr(os, "O_NOFOLLOW", 0),
+        )
+    except FileNotFoundError as e:
+        _negative_cache[path] = time.monotonic()
+        if len(_negative_cache) > _NEGATIVE_CACHE_MAX:
+            _negative_cache.popitem(last=False)
+        raise FileNotFoundError(f"File not found: {path}") from e
+    except IsADirectoryError as e:
+        raise IsADirectoryError(f"Path is a directory: {path}") from e
+    except NotADirectoryError as e:
+        # A file used as a directory ("welcome.txt/sub"); report it like a
+        # missing file so the raw error's absolute host path never leaks
+        raise FileNotFoundError(f"File not found: {path}") from e
+    except OSError as e:
+        if e.errno == errno.ELOOP:
+            # O_NOFOLLOW reports a symlink final component as ELOOP
+            raise PathValidationError(f"Symlinks are not allowed: {path}") from e
+        raise
+
+    _negative_cache.pop(path, None)
 
-    if full_path.is_dir():
-        raise IsADirectoryError(f"Path is a directory: {path}")
+    try:
+        st = os.fstat(fd)
+        if stat.S_ISDIR(st.st_mode):
+            raise IsADirectoryError(f"Path is a directory: {path}")
+
+        # Read into a size-preallocated buffer so the bytes arrive in one
+        # readv per chunk with no growable-buffer reallocations
+        buf = bytearray(st.st_size)
+        view = memoryview(buf)
+        offset = 0
+        while offset < st.st_size:
+            if _HAS_READV:
+                count = os.readv(fd, [view[offset:]])
+            else:
+                chunk = os.read(fd, st.st_size - offset)
+                count = len(chunk)
+                buf[offset:offset + count] = chunk
+            if count == 0:
+                break
+            offset += count
+    finally:
+        os.close(fd)
 
+    # A full read (the overwhelmingly common case) decodes the buffer in
+    # place; only a short read pays for a trimmed copy
+    data = buf if offset == st.st_size else bytes(view[:offset])
     try:
-        return full_path.read_text(encoding='utf-8')
+        return data.decode('utf-8')
     except UnicodeDecodeError as e:
         raise UnicodeDecodeError(
             e.encoding, e.object, e.start, e.end,
@@ -1,5 +1,108 @@
 """Prompt templates for the MCP server."""
 
+import functools
+
+
+# Static template text, precomputed so each render is a single C-level
+# %-interpolation rather than a chain of BUILD_STRING steps.
+
+_SUMMARIZE_TEXT_TMPL = """Please provide a concise summary of the following text. Focus on the main ideas and key points:
+
+%s
+
+Summary:"""
+
+_EXTRACT_TASKS_TMPL = """Analyze the following text and extract all actionable tasks, action items, and TODOs.
+Format each task as a clear, actionable item with any mentioned deadlines or assignees.
+
+Text:
+%s
+
+Tasks:"""
+
+_ANALYZE_CODE_TMPL = """Analyze the following %s code. Provide insights on:
+1. Code quality and readability
+2. Potential bugs or issues
+3. Performance considerations
+4. Security vulnerabilities
+5. Suggestions for improvement
+
+Code:
+```%s
+%s
+```
+
+Analysis:"""
+
+_DESIGN_DOC_TMPL = """Create a detailed technical design document for the following feature:%s
+
+Feature Description:
+%s
+
+Please structure the design document with the following sections:
+1. Overview and Goals
+2. Architecture and Components
+3. Implementation Approach
+4. API/Interface Design
+5. Data Models (if applicable)
+6. Security Considerations
+7. Testing Strategy
+8. Alternative Approaches Considered
+9. Open Questions and Risks
+
+Design Document:"""
+
+_DESIGN_DOC_CONTEXT_TMPL = "\n\nProject Context:\n%s"
+
+_REFACTOR_TMPL = """Provide detailed refactoring instructions for the following %s code.
+
+Issues to address:
+%s
+
+Current Code:
+```%s
+%s
+```
+
+Please provide:
+1. Step-by-step refactoring instructions
+2. Explanation of why each change improves the code
+3. The refactored code
+4. Any potential risks or considerations
+
+Refactoring Instructions:"""
+
+
+# The public prompt functions below only do string formatting, so repeated
+# calls with the same input (common when an agent retries) can reuse the
+# rendered prompt. The cached builders are kept private because FastMCP
+# introspects registered functions and cannot handle lru_cache wrappers.
+
+@functools.lru_cache(maxsize=128)
+def _render_summarize_text(text: str) -> str:
+    return _SUMMARIZE_TEXT_TMPL % text
+
+
+@functools.lru_cache(maxsize=128)
+def _render_extract_tasks(text: str) -> str:
+    return _EXTRACT_TASKS_TMPL % text
+
+
+@functools.lru_cache(maxsize=128)
+def _render_analyze_code(code: str, language: str) -> str:
+    return _ANALYZE_CODE_TMPL % (language, language, code)
+
+
+@functools.lru_cache(maxsize=128)
+def _render_write_design_doc(feature_description: str, context: str) -> str:
+    context_section = _DESIGN_DOC_CONTEXT_TMPL % context if context else ""
+    return _DESIGN_DOC_TMPL % (context_section, feature_description)
+
+
+@functools.lru_cache(maxsize=128)
+def _render_refactor_instructions(code: str, issues: str, language: str) -> str:
+    return _REFACTOR_TMPL % (language, issues, language, code)
+
 
 def summarize_text(text: str) -> str:
     """
@@ -14,11 +117,7 @@ def summarize_text(text: str) -> str:
     Returns:
         A formatted prompt requesting a summary of the text
     """
-    return f"""Please provide a concise summary of the following text. Focus on the main ideas and key points:
-
-{text}
-
-Summary:"""
+    return _render_summarize_text(text)
 
 
 def extract_tasks(text: str) -> str:
@@ -34,13 +133,7 @@ def extract_tasks(text: str) -> str:
     Returns:
         A formatted prompt requesting extraction of tasks from the text
     """
-    return f"""Analyze the following text and extract all actionable tasks, action items, and TODOs.
-Format each task as a clear, actionable item with any mentioned deadlines or assignees.
-
-Text:
-{text}
-
-Tasks:"""
+    return _render_extract_tasks(text)
 
 
 def analyze_code(code: str, language: str = "python") -> str:
@@ -57,19 +150,7 @@ def analyze_code(code: str, language: str = "python") -> str:
     Returns:
         A formatted prompt requesting code analysis
     """
-    return f"""Analyze the following {language} code. Provide insights on:
-1. Code quality and readability
-2. Potential bugs or issues
-3. Performance considerations
-4. Security vulnerabilities
-5. Suggestions for improvement
-
-Code:
-```{language}
-{code}
-```
-
-Analysis:"""
+    return _render_analyze_code(code, language)
 
 
 def write_design_doc(feature_description: str, context: str = "") -> str:
@@ -86,25 +167,7 @@ def write_design_doc(feature_description: str, context: str = "") -> str:
     Returns:
         A formatted prompt requesting a design document
     """
-    context_section = f"\n\nProject Context:\n{context}" if context else ""
-
-    return f"""Create a detailed technical design document for the following feature:{context_section}
-
-Feature Description:
-{feature_description}
-
-Please structure the design document with the following sections:
-1. Overview and Goals
-2. Architecture and Components
-3. Implementation Approach
-4. API/Interface Design
-5. Data Models (if applicable)
-6. Security Considerations
-7. Testing Strategy
-8. Alternative Approaches Considered
-9. Open Questions and Risks
-
-Design Document:"""
+    return _render_write_design_doc(feature_description, context)
 
 
 def refactor_instructions(code: str, issues: str, language: str = "python") -> str:
@@ -122,23 +185,7 @@ def refactor_instructions(code: str, issues: str, language: str = "python") -> s
     Returns:
         A formatted prompt requesting refactoring instructions
     """
-    return f"""Provide detailed refactoring instructions for the following {language} code.
-
-Issues to address:
-{issues}
-
-Current Code:
-```{language}
-{code}
-```
-
-Please provide:
-1. Step-by-step refactoring instructions
-2. Explanation of why each change improves the code
-3. The refactored code
-4. Any potential risks or considerations
-
-Refactoring Instructions:"""
+    return _render_refactor_instructions(code, issues, language)
 
 
 def summarize_prompt(text: str) -> str:
@@ -155,4 +202,4 @@ def summarize_prompt(text: str) -> str:
     Returns:
         A formatted prompt requesting a summary of the text
     """
-    return summarize_text(text)
+    return _render_summarize_text(text)
@@ -23,8 +23,7 @@ def ozfs_resource(path: str) -> str:
         FileNotFoundError: If file doesn't exist
         IsADirectoryError: If path is a directory
     """
-    # Remove leading slash if present
-    if path.startswith('/'):
-        path = path[1:]
+    # Remove leading slashes so the path is relative to the sandbox
+    path = path.lstrip('/')
 
     return read_file(path)
@@ -1,8 +1,11 @@
 """MCP server entrypoint for penr-oz."""
 
+from contextlib import asynccontextmanager
+
 from fastmcp import FastMCP
 
-from app.api import fetch_json
+import app.api
+from app.api import fetch_json, fetch_json_many
 from app.config import SERVER_NAME
 from app.prompts import (
     summarize_text,
@@ -15,38 +18,50 @@ from app.prompts import (
 from app.resources import info, ozfs_resource
 from app.tools import ping, list_files, read_text_file
 
+# Registration tables: adding a component is a one-line change here
+_TOOLS = (ping, list_files, read_text_file, fetch_json, fetch_json_many)
+_RESOURCES = (("oz://info", info), ("ozfs://{path}", ozfs_resource))
+_PROMPTS = (
+    summarize_text,
+    extract_tasks,
+    analyze_code,
+    write_design_doc,
+    refactor_instructions,
+    summarize_prompt,  # Legacy prompt (for backward compatibility)
+)
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    """Release the shared HTTP client on the loop that owns its connections."""
+    try:
+        yield
+    finally:
+        await app.api.aclose()
+
 
 def create_mcp() -> FastMCP:
     """Create and configure the FastMCP server instance."""
-    mcp = FastMCP(name=SERVER_NAME)
-
-    # Register tools
-    mcp.tool(ping)
-    mcp.tool(list_files)
-    mcp.tool(read_text_file)
-    mcp.tool(fetch_json)
+    mcp = FastMCP(name=SERVER_NAME, lifespan=_lifespan)
 
-    # Register resources
-    mcp.resource("oz://info")(info)
-    mcp.resource("ozfs://{path}")(ozfs_resource)
+    for tool in _TOOLS:
+        mcp.tool(tool)
 
-    # Register prompts
-    mcp.prompt(summarize_text)
-    mcp.prompt(extract_tasks)
-    mcp.prompt(analyze_code)
-    mcp.prompt(write_design_doc)
-    mcp.prompt(refactor_instructions)
+    for uri, resource in _RESOURCES:
+        mcp.resource(uri)(resource)
 
-    # Legacy prompts (for backward compatibility)
-    mcp.prompt(summarize_prompt)
+    for prompt in _PROMPTS:
+        mcp.prompt(prompt)
 
     return mcp
 
 
 def main() -> None:
     """Run the MCP server."""
-    mcp = create_mcp()
-    mcp.run()
+    # The lifespan closes the shared HTTP client inside the serving loop;
+    # closing it after run() would land on a fresh loop while the pooled
+    # connections still belong to the one that just closed
+    create_mcp().run()
 
 
 if __name__ == "__main__":
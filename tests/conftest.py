@@ -0,0 +1,30 @@
+"""Shared fixtures for the test suite."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+# Make the repo root importable once for the whole session instead of
+# repeating (and re-resolving) this in every test module
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture(scope="session")
+def mcp():
+    """Session-wide FastMCP instance so the server graph is built once."""
+    from server import create_mcp
+
+    return create_mcp()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def prompt_names(mcp):
+    """Names of all prompts registered on the session server instance."""
+    prompts = await mcp.get_prompts()
+    return frozenset(
+        prompts.keys() if isinstance(prompts, dict) else (p.name for p in prompts)
+    )
@@ -6,6 +6,7 @@ import respx
 import httpx
 from app.api import (
     fetch_json,
+    fetch_json_many,
     InvalidURLError,
     TimeoutError,
     HTTPError,
@@ -153,3 +154,63 @@ async def test_fetch_json_cancelled_error_propagates(respx_mock):
     # CancelledError should propagate, not be wrapped in APIError
     with pytest.raises(asyncio.CancelledError):
         await task
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_fetch_json_many_success(respx_mock):
+    """Test that multiple URLs are fetched and returned in order."""
+    respx_mock.get("https://api.example.com/a").mock(
+        return_value=httpx.Response(200, json={"name": "a"})
+    )
+    respx_mock.get("https://api.example.com/b").mock(
+        return_value=httpx.Response(200, json={"name": "b"})
+    )
+
+    results = await fetch_json_many([
+        "https://api.example.com/a",
+        "https://api.example.com/b",
+    ])
+
+    assert results == [{"name": "a"}, {"name": "b"}]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_fetch_json_many_reports_errors_inline(respx_mock):
+    """Test that a failing URL doesn't sink the rest of the batch."""
+    respx_mock.get("https://api.example.com/good").mock(
+        return_value=httpx.Response(200, json={"ok": True})
+    )
+    respx_mock.get("https://api.example.com/bad").mock(
+        return_value=httpx.Response(404, json={"error": "Not found"})
+    )
+
+    results = await fetch_json_many([
+        "https://api.example.com/good",
+        "https://api.example.com/bad",
+    ])
+
+    assert results[0] == {"ok": True}
+    assert results[1]["url"] == "https://api.example.com/bad"
+    assert "404" in results[1]["error"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_json_many_empty_list():
+    """Test that an empty URL list returns an empty result list."""
+    results = await fetch_json_many([])
+    assert results == []
+
+
+def test_client_recreated_and_closed_on_loop_change():
+    """Test that a new loop gets a fresh client and the old one is closed."""
+    from app import api
+
+    first = asyncio.run(api._get_client())
+    second = asyncio.run(api._get_client())
+    try:
+        assert second is not first
+        assert first.is_closed
+    finally:
+        asyncio.run(api.aclose())
@@ -2,115 +2,173 @@
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-import pytest
+import os
+import re
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+import pytest
 
+from app import filesystem
 from app.filesystem import (
     validate_path,
     list_directory,
     read_file,
     PathValidationError,
 )
-from app.config import SANDBOX_ROOT
 
+# Compiled once; pytest.raises(match=...) accepts patterns directly, so
+# the same two expressions aren't re-compiled in every assertion
+ESCAPE_SANDBOX = re.compile("escape sandbox")
+SYMLINKS_NOT_ALLOWED = re.compile("Symlinks are not allowed")
 
-class TestPathValidation:
-    """Test path validation and security."""
 
-    def test_validate_simple_path(self):
-        """Valid simple path should resolve correctly."""
-        result = validate_path("welcome.txt")
-        assert result.is_absolute()
-        assert str(result).startswith(str(SANDBOX_ROOT.resolve()))
+@pytest.fixture(scope="module", autouse=True)
+def sandbox(tmp_path_factory):
+    """
+    Build an isolated sandbox and point the filesystem module at it.
+
+    Tests no longer mutate the repo's shared sandbox/ directory, so they
+    can run in parallel (pytest -n auto) without colliding on symlink
+    names or leaking state between workers.
+    """
+    root = tmp_path_factory.mktemp("sandbox")
+    docs = root / "docs"
+    data = root / "data"
+    (root / "welcome.txt").write_text("Welcome to the penr-oz sandbox!\n")
+    docs.mkdir()
+    (docs / "guide.md").write_text("# User Guide\n")
+    data.mkdir()
+    (data / "sample.json").write_text('{"name": "penr-oz-mcp-server"}\n')
+    (data / "notes.txt").write_text("Sample notes.\n")
+
+    resolved = root.resolve()
+    patcher = pytest.MonkeyPatch()
+    patcher.setattr("app.config.SANDBOX_ROOT", root)
+    patcher.setattr("app.config.SANDBOX_ROOT_RESOLVED", resolved)
+    patcher.setattr(filesystem, "SANDBOX_ROOT", root)
+    patcher.setattr(filesystem, "SANDBOX_ROOT_RESOLVED", resolved)
+    patcher.setattr(filesystem, "_SANDBOX_PREFIX", os.fspath(resolved) + os.sep)
+    filesystem._clear_validation_cache()
+
+    yield root
+
+    filesystem._clear_validation_cache()
+    patcher.undo()
+
+
+@pytest.fixture(scope="module")
+def sandbox_resolved(sandbox):
+    """Resolved sandbox root, computed once per module."""
+    return sandbox.resolve()
+
+
+@pytest.fixture(scope="module")
+def welcome_content(sandbox):
+    """Contents of welcome.txt, read once per module."""
+    return read_file("welcome.txt")
+
+
+@pytest.fixture(scope="module")
+def data_listing(sandbox):
+    """Listing of data/, computed once for the read-only assertions.
+
+    Safe to share: listings skip symlinks, so the function-scoped symlink
+    fixtures can't change what this returns.
+    """
+    return list_directory("data")
+
 
-    def test_validate_subdirectory_path(self):
-        """Valid subdirectory path should resolve correctly."""
-        result = validate_path("docs/guide.md")
-        assert result.is_absolute()
-        assert str(result).startswith(str(SANDBOX_ROOT.resolve()))
+def _make_symlink(sandbox, name, target):
+    """Create sandbox/name pointing at sandbox/target and return the link."""
+    link_path = sandbox / name
+    link_path.symlink_to(sandbox / target)
+    return link_path
 
-    def test_validate_empty_path(self):
+
+# Each security test takes exactly the link it exercises; teardown is a
+# single unlink(missing_ok=True), which unlike the exists()-then-unlink
+# dance also removes broken symlinks (exists() follows the link and
+# reports False for them)
+
+@pytest.fixture
+def file_symlink(sandbox):
+    """Symlink to a file at the sandbox root."""
+    link_path = _make_symlink(sandbox, "test_link", "welcome.txt")
+    yield link_path
+    link_path.unlink(missing_ok=True)
+
+
+@pytest.fixture
+def dir_symlink(sandbox):
+    """Symlink to a directory at the sandbox root."""
+    link_path = _make_symlink(sandbox, "link_dir", "docs")
+    yield link_path
+    link_path.unlink(missing_ok=True)
+
+
+@pytest.fixture
+def read_symlink(sandbox):
+    """Symlink used by the read_file rejection test."""
+    link_path = _make_symlink(sandbox, "read_link", "welcome.txt")
+    yield link_path
+    link_path.unlink(missing_ok=True)
+
+
+@pytest.fixture
+def list_symlink(sandbox):
+    """Symlink inside data/ used by the listing test."""
+    link_path = _make_symlink(sandbox, "data/test_link", "welcome.txt")
+    yield link_path
+    link_path.unlink(missing_ok=True)
+
+
+class TestPathValidation:
+    """Test path validation and security."""
+
+    @pytest.mark.parametrize("path", [
+        "welcome.txt",                # simple path
+        "docs/guide.md",              # subdirectory path
+        "/welcome.txt",               # leading slash is stripped
+        "..%2F..%2Fetc%2Fpasswd",     # URL-encoded traversal is a literal name
+        "/etc/passwd",                # absolute paths are relative to sandbox
+    ])
+    def test_validate_path_stays_in_sandbox(self, path, sandbox_resolved):
+        """Valid paths should resolve to absolute paths inside the sandbox."""
+        result = validate_path(path)
+        # is_relative_to on an absolute anchor implies the result is
+        # absolute, and compares path parts rather than string prefixes
+        # (so a sibling like "sandbox_backup" could never pass)
+        assert result.is_relative_to(sandbox_resolved)
+
+    @pytest.mark.parametrize("path", [
+        "../etc/passwd",                  # simple .. traversal
+        "docs/../../etc/passwd",          # traversal through a subdirectory
+        "../sandbox_sibling/secret.txt",  # sibling directory with similar prefix
+    ])
+    def test_validate_path_blocks_escape(self, path):
+        """Paths that would leave the sandbox should be rejected."""
+        with pytest.raises(PathValidationError, match=ESCAPE_SANDBOX):
+            validate_path(path)
+
+    def test_validate_empty_path(self, sandbox_resolved):
         """Empty path should resolve to sandbox root."""
         result = validate_path("")
-        assert result.resolve() == SANDBOX_ROOT.resolve()
-
-    def test_validate_leading_slash(self):
-        """Path with leading slash should be handled correctly."""
-        result = validate_path("/welcome.txt")
-        assert result.is_absolute()
-        assert str(result).startswith(str(SANDBOX_ROOT.resolve()))
-
-    def test_prevent_directory_traversal_dotdot(self):
-        """Directory traversal with .. should be blocked."""
-        with pytest.raises(PathValidationError, match="escape sandbox"):
-            validate_path("../etc/passwd")
-
-    def test_prevent_directory_traversal_multiple_dotdot(self):
-        """Multiple .. traversal attempts should be blocked."""
-        with pytest.raises(PathValidationError, match="escape sandbox"):
-            validate_path("docs/../../etc/passwd")
-
-    def test_prevent_directory_traversal_encoded(self):
-        """Encoded directory traversal characters are treated literally."""
-        # URL encoded paths are treated as literal filenames by Path
-        # This is acceptable since the resolve() check will catch actual traversal
-        result = validate_path("..%2F..%2Fetc%2Fpasswd")
-        assert str(result).startswith(str(SANDBOX_ROOT.resolve()))
-
-    def test_prevent_absolute_path_escape(self):
-        """Absolute paths are treated as relative to sandbox root."""
-        # Leading slashes are stripped, so /etc/passwd becomes sandbox/etc/passwd
-        result = validate_path("/etc/passwd")
-        assert str(result).startswith(str(SANDBOX_ROOT.resolve()))
-        # The path is treated as relative to sandbox
-        assert result == SANDBOX_ROOT / "etc/passwd"
-
-    def test_prevent_sibling_directory_attack(self):
-        """Sibling directories with similar prefixes should be blocked."""
-        # If sandbox is at /path/to/sandbox, paths like ../sandbox_backup
-        # should be blocked even though "sandbox_backup" starts with "sandbox"
-        with pytest.raises(PathValidationError, match="escape sandbox"):
-            # Try to escape to a sibling directory
-            validate_path("../sandbox_sibling/secret.txt")
-
-    def test_reject_symlinks(self):
-        """Symlinks should be rejected to prevent information leakage."""
-        # Create a symlink in the sandbox
-        link_path = SANDBOX_ROOT / "test_link"
-        target_path = SANDBOX_ROOT / "welcome.txt"
+        assert result.resolve() == sandbox_resolved
 
-        try:
-            link_path.symlink_to(target_path)
+    def test_absolute_path_treated_as_relative(self, sandbox_resolved):
+        """Leading slashes are stripped, so /etc/passwd maps into the sandbox."""
+        assert validate_path("/etc/passwd") == sandbox_resolved / "etc/passwd"
 
-            # Accessing the symlink should raise an error
-            with pytest.raises(PathValidationError, match="Symlinks are not allowed"):
-                validate_path("test_link")
-        finally:
-            # Clean up
-            if link_path.exists():
-                link_path.unlink()
+    def test_reject_symlinks(self, file_symlink):
+        """Symlinks should be rejected to prevent information leakage."""
+        # Accessing the symlink should raise an error
+        with pytest.raises(PathValidationError, match=SYMLINKS_NOT_ALLOWED):
+            validate_path("test_link")
 
-    def test_reject_symlink_in_directory_path(self):
+    def test_reject_symlink_in_directory_path(self, dir_symlink):
         """Symlinks in directory paths should be rejected."""
-        # Create a symlinked directory
-        link_dir = SANDBOX_ROOT / "link_dir"
-        target_dir = SANDBOX_ROOT / "docs"
-
-        try:
-            link_dir.symlink_to(target_dir)
-
-            # Accessing through the symlinked directory should fail
-            with pytest.raises(PathValidationError, match="Symlinks are not allowed"):
-                validate_path("link_dir/guide.md")
-        finally:
-            # Clean up
-            if link_dir.exists():
-                link_dir.unlink()
+        # Accessing through the symlinked directory should fail
+        with pytest.raises(PathValidationError, match=SYMLINKS_NOT_ALLOWED):
+            validate_path("link_dir/guide.md")
 
 
 class TestListDirectory:
@@ -150,69 +208,71 @@ class TestListDirectory:
 
     def test_list_directory_traversal_blocked(self):
         """Directory traversal in list should be blocked."""
-        with pytest.raises(PathValidationError, match="escape sandbox"):
+        with pytest.raises(PathValidationError, match=ESCAPE_SANDBOX):
             list_directory("../")
 
-    def test_list_returns_sorted_entries(self):
+    def test_list_returns_sorted_entries(self, data_listing):
         """Directory listing should return sorted entries."""
-        entries = list_directory("data")
-        names = [e["name"] for e in entries]
+        names = [e["name"] for e in data_listing]
 
-        # Check if sorted
-        assert names == sorted(names)
+        # Pairwise check short-circuits on the first inversion and skips
+        # the sorted copy that comparing against sorted(names) would build
+        assert all(a <= b for a, b in zip(names, names[1:]))
 
-    def test_list_includes_file_sizes(self):
+    def test_list_includes_file_sizes(self, data_listing):
         """File entries should include size information."""
-        entries = list_directory("data")
-
-        for entry in entries:
+        for entry in data_listing:
             if entry["type"] == "file":
                 assert "size" in entry
                 assert isinstance(entry["size"], int)
                 assert entry["size"] >= 0
 
-    def test_list_skips_symlinks(self):
-        """Directory listing should skip symlinks."""
-        # Create a symlink in a directory
-        link_path = SANDBOX_ROOT / "data" / "test_link"
-        target_path = SANDBOX_ROOT / "welcome.txt"
-
+    def test_list_rejects_symlink_created_after_validation(
+        self, sandbox, tmp_path_factory
+    ):
+        """A symlinked directory appearing while cached should be rejected."""
+        outside = tmp_path_factory.mktemp("outside")
+        (outside / "secret.txt").write_text("secret\n")
+        # The link has to appear *after* validation caches the name, so it
+        # can't come from a fixture like the other symlink tests
+        validate_path("loot")
+        link_path = sandbox / "loot"
+        link_path.symlink_to(outside)
         try:
-            link_path.symlink_to(target_path)
+            with pytest.raises(PathValidationError, match=SYMLINKS_NOT_ALLOWED):
+                list_directory("loot")
+        finally:
+            link_path.unlink(missing_ok=True)
 
-            # List the directory
-            entries = list_directory("data")
-            names = [e["name"] for e in entries]
+    def test_list_skips_symlinks(self, list_symlink):
+        """Directory listing should skip symlinks."""
+        entries = list_directory("data")
+        names = [e["name"] for e in entries]
 
-            # Symlink should not appear in listing
-            assert "test_link" not in names
-        finally:
-            # Clean up
-            if link_path.exists():
-                link_path.unlink()
+        # Symlink should not appear in listing
+        assert "test_link" not in names
 
 
 class TestReadFile:
     """Test file reading functionality."""
 
-    def test_read_simple_file(self):
-        """Reading a simple file should return content."""
-        content = read_file("welcome.txt")
-        assert isinstance(content, str)
-        assert len(content) > 0
-        assert "Welcome" in content
-
-    def test_read_subdirectory_file(self):
-        """Reading file in subdirectory should work."""
-        content = read_file("docs/guide.md")
+    @pytest.mark.parametrize("path,expected", [
+        ("welcome.txt", "Welcome"),                   # simple file
+        ("docs/guide.md", "User Guide"),              # subdirectory file
+        ("data/sample.json", "penr-oz-mcp-server"),   # JSON file as text
+        ("/welcome.txt", "Welcome"),                  # leading slash
+    ])
+    def test_read_file_paths(self, path, expected):
+        """Each distinct read path should return the file's text content."""
+        content = read_file(path)
         assert isinstance(content, str)
-        assert "User Guide" in content
+        assert expected in content
 
-    def test_read_json_file(self):
-        """Reading JSON file should return text content."""
-        content = read_file("data/sample.json")
-        assert isinstance(content, str)
-        assert "penr-oz-mcp-server" in content
+    def test_read_simple_file(self, welcome_content):
+        """Reading a simple file should return content."""
+        assert isinstance(welcome_content, str)
+        assert len(welcome_content) > 0
+        assert "Welcome" in welcome_content
 
     def test_read_nonexistent_file(self):
         """Reading nonexistent file should raise FileNotFoundError."""
@@ -224,60 +284,75 @@ class TestReadFile:
         with pytest.raises(IsADirectoryError):
             read_file("docs")
 
+    def test_read_through_file_reports_not_found(self):
+        """Using a file as a directory should read as a missing file."""
+        # The raw ENOTDIR message would leak the absolute host path
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            read_file("welcome.txt/sub")
+
     def test_read_directory_traversal_blocked(self):
         """Directory traversal in read should be blocked."""
-        with pytest.raises(PathValidationError, match="escape sandbox"):
+        with pytest.raises(PathValidationError, match=ESCAPE_SANDBOX):
             read_file("../../../etc/passwd")
 
-    def test_read_with_leading_slash(self):
-        """Reading with leading slash should work."""
-        content = read_file("/welcome.txt")
-        assert isinstance(content, str)
-        assert "Welcome" in content
-
-    def test_read_rejects_symlinks(self):
+    def test_read_rejects_symlinks(self, read_symlink):
         """Reading symlinks should be rejected."""
-        # Create a symlink
-        link_path = SANDBOX_ROOT / "read_link"
-        target_path = SANDBOX_ROOT / "welcome.txt"
-
+        # Reading the symlink should fail
+        with pytest.raises(PathValidationError, match=SYMLINKS_NOT_ALLOWED):
+            read_file("read_link")
+
+    def test_read_rejects_symlink_created_after_validation(self, sandbox):
+        """A symlink created while its path is still cached should be rejected."""
+        # The link has to appear *after* validation, so it can't come from
+        # a fixture like the other symlink tests
+        validate_path("late_link")
+        link_path = _make_symlink(sandbox, "late_link", "welcome.txt")
         try:
-            link_path.symlink_to(target_path)
-
-            # Reading the symlink should fail
-            with pytest.raises(PathValidationError, match="Symlinks are not allowed"):
-                read_file("read_link")
+            with pytest.raises(PathValidationError, match=SYMLINKS_NOT_ALLOWED):
+                read_file("late_link")
+        finally:
+            link_path.unlink(missing_ok=True)
+
+    def test_read_rejects_symlinked_parent_after_validation(
+        self, sandbox, tmp_path_factory
+    ):
+        """A parent turning into a symlink while cached should be rejected."""
+        outside = tmp_path_factory.mktemp("outside")
+        (outside / "inner.txt").write_text("secret\n")
+        validate_path("late_dir/inner.txt")
+        link_path = sandbox / "late_dir"
+        link_path.symlink_to(outside)
+        try:
+            with pytest.raises(PathValidationError, match=SYMLINKS_NOT_ALLOWED):
+                read_file("late_dir/inner.txt")
         finally:
-            # Clean up
-            if link_path.exists():
-                link_path.unlink()
+            link_path.unlink(missing_ok=True)
 
 
 class TestSandboxIntegration:
     """Integration tests for sandbox security."""
 
-    def test_sandbox_root_exists(self):
+    def test_sandbox_root_exists(self, sandbox):
         """Sandbox root directory should exist or be created."""
-        assert SANDBOX_ROOT.exists()
-        assert SANDBOX_ROOT.is_dir()
+        assert sandbox.exists()
+        assert sandbox.is_dir()
 
-    def test_cannot_escape_sandbox_with_symlink_path(self):
+    def test_cannot_escape_sandbox_with_symlink_path(self, sandbox_resolved):
         """Paths that would escape via symlinks should be blocked."""
         # This tests the resolve() behavior
         result = validate_path("docs/../welcome.txt")
 
         # Should resolve to sandbox/welcome.txt
-        assert result.resolve() == (SANDBOX_ROOT / "welcome.txt").resolve()
+        assert result.resolve() == sandbox_resolved / "welcome.txt"
 
-    def test_multiple_operations_maintain_security(self):
+    def test_multiple_operations_maintain_security(self, welcome_content):
         """Multiple operations should all respect sandbox."""
         # List root
         entries = list_directory("")
         assert len(entries) > 0
 
-        # Read a file
-        content = read_file("welcome.txt")
-        assert len(content) > 0
+        # Reuse the cached file read
+        assert len(welcome_content) > 0
 
         # List subdirectory
         docs_entries = list_directory("docs")
@@ -2,13 +2,7 @@
 
 from __future__ import annotations
 
-import asyncio
-import sys
-from pathlib import Path
-
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+import pytest
 
 from app.prompts import (
     summarize_text,
@@ -18,7 +12,6 @@ from app.prompts import (
     refactor_instructions,
     summarize_prompt,
 )
-from server import create_mcp
 
 
 # ---------------------------------------------------------------------------
@@ -150,33 +143,30 @@ def test_refactor_instructions_covers_deliverables() -> None:
 # Backward compatibility
 # ---------------------------------------------------------------------------
 
-def test_summarize_prompt_backward_compatibility() -> None:
-    """Test that legacy summarize_prompt still works."""
+# New legacy aliases only need a (legacy, current) pair added here
+@pytest.mark.parametrize("legacy,current", [
+    (summarize_prompt, summarize_text),
+])
+def test_legacy_aliases_match_current(legacy, current) -> None:
+    """Test that legacy prompt aliases produce the current output."""
     text = "This is a test document."
-    legacy_result = summarize_prompt(text)
-    new_result = summarize_text(text)
-
-    # Legacy function should produce the same output as the new one
-    assert legacy_result == new_result
+    assert legacy(text) == current(text)
 
 
 # ---------------------------------------------------------------------------
 # Registration
 # ---------------------------------------------------------------------------
 
-def test_all_prompts_registered() -> None:
+@pytest.mark.asyncio(loop_scope="session")
+async def test_all_prompts_registered(prompt_names) -> None:
     """Test that all prompts including legacy are registered."""
-    mcp = create_mcp()
-    prompts = asyncio.run(mcp.get_prompts())
-
-    prompt_names = list(prompts.keys()) if isinstance(prompts, dict) else [p.name for p in prompts]
-
-    # Check new prompts are registered
-    assert "summarize_text" in prompt_names
-    assert "extract_tasks" in prompt_names
-    assert "analyze_code" in prompt_names
-    assert "write_design_doc" in prompt_names
-    assert "refactor_instructions" in prompt_names
-
-    # Check legacy prompt is also registered for backward compatibility
-    assert "summarize_prompt" in prompt_names
+    # One subset check covers the new prompts and the legacy
+    # summarize_prompt alias
+    assert {
+        "summarize_text",
+        "extract_tasks",
+        "analyze_code",
+        "write_design_doc",
+        "refactor_instructions",
+        "summarize_prompt",
+    } <= prompt_names
@@ -3,23 +3,17 @@
 from __future__ import annotations
 
 import asyncio
-import sys
-from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+import pytest
 
-from server import create_mcp
 
-
-def test_server_registers_components() -> None:
+@pytest.mark.asyncio(loop_scope="session")
+async def test_server_registers_components(mcp) -> None:
     """Server initializes with at least one tool, resource, and prompt."""
-    mcp = create_mcp()
-
-    tools = asyncio.run(mcp.get_tools())
-    resources = asyncio.run(mcp.get_resources())
-    prompts = asyncio.run(mcp.get_prompts())
+    # The three lookups are independent, so run them concurrently
+    tools, resources, prompts = await asyncio.gather(
+        mcp.get_tools(), mcp.get_resources(), mcp.get_prompts()
+    )
 
     assert tools, "Expected at least one registered tool."
     assert resources, "Expected at least one registered resource."